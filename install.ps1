@@ -311,12 +311,31 @@ function Setup-Venv {
         Write-Ok "Virtual environment exists"
     }
 
+    # Skip dependency install when requirements are unchanged since last run
+    $reqFile = Join-Path $SosieDir "requirements.txt"
+    $reqMarker = Join-Path $venvDir ".requirements-hash"
+    $reqHash = $null
+    if (Test-Path $reqFile) {
+        $reqHash = (Get-FileHash $reqFile -Algorithm SHA256).Hash
+    }
+    if ($reqHash -and (Test-Path $reqMarker) -and ((Get-Content $reqMarker) -eq $reqHash)) {
+        Write-Ok "Python dependencies up to date"
+        return
+    }
+
     # Upgrade pip
     & $venvPython -m pip install --upgrade pip --quiet 2>$null
 
     # Install requirements
     Write-Ok "Installing Python dependencies (this may take a few minutes)..."
-    & $venvPip install -r (Join-Path $SosieDir "requirements.txt") --quiet
+    & $venvPip install -r $reqFile --quiet
+
+    # Remember what was installed so unchanged re-runs can skip pip entirely
+    # (only on success — a recorded hash after a failed install would skip
+    # the retry on the next run)
+    if ($reqHash -and $LASTEXITCODE -eq 0) {
+        Set-Content $reqMarker $reqHash -Encoding ASCII
+    }
 
     Write-Ok "Python dependencies installed"
 }
@@ -108,7 +108,7 @@ ensure_python() {
 
     # Query python-build-standalone for the latest release with our Python version
     local release_json
-    release_json="$(curl -sfL "https://api.github.com/repos/astral-sh/python-build-standalone/releases?per_page=5")"
+    release_json="$(curl -sfL --compressed "https://api.github.com/repos/astral-sh/python-build-standalone/releases?per_page=5")"
 
     local download_url
     # The GitHub API URL-encodes "+" as "%2B" in browser_download_url
@@ -164,7 +164,7 @@ ensure_node() {
 
     # Get latest v20.x version from Node.js index
     local node_version
-    node_version="$(curl -sfL "https://nodejs.org/dist/index.json" \
+    node_version="$(curl -sfL --compressed "https://nodejs.org/dist/index.json" \
         | grep -o "\"v${NODE_MAJOR}\.[0-9]*\.[0-9]*\"" \
         | head -1 \
         | tr -d '"')"
@@ -214,7 +214,7 @@ resolve_version() {
     warn "Source ${SOURCE_REPO}@${SOURCE_REF} not accessible — falling back to latest release"
 
     local release_json
-    release_json="$(curl -sfL "https://api.github.com/repos/${RELEASES_REPO}/releases/latest")"
+    release_json="$(curl -sfL --compressed "https://api.github.com/repos/${RELEASES_REPO}/releases/latest")"
 
     if [[ -z "$release_json" ]]; then
         fail "Could not fetch latest release from GitHub."
@@ -329,6 +329,31 @@ setup_venv() {
         info "Virtual environment exists"
     fi
 
+    # Skip dependency install when requirements are unchanged since last run.
+    # Hash only files that exist — a missing requirements.txt just disables
+    # the cache and falls through to pip's own (visible) error.
+    local req_files=()
+    if [[ -f "$SOSIE_DIR/requirements.txt" ]]; then
+        req_files+=("$SOSIE_DIR/requirements.txt")
+    fi
+    if [[ "$OS" == "macos" ]] && [[ -f "$SOSIE_DIR/requirements-macos.txt" ]]; then
+        req_files+=("$SOSIE_DIR/requirements-macos.txt")
+    fi
+    local req_hash=""
+    if [[ ${#req_files[@]} -gt 0 ]]; then
+        if command_exists sha256sum; then
+            req_hash="$(cat "${req_files[@]}" | sha256sum | awk '{print $1}')"
+        elif command_exists shasum; then
+            req_hash="$(cat "${req_files[@]}" | shasum -a 256 | awk '{print $1}')"
+        fi
+    fi
+    local req_marker="$venv_dir/.requirements-hash"
+    if [[ -n "$req_hash" ]] && [[ -f "$req_marker" ]] \
+        && [[ "$(cat "$req_marker")" == "$req_hash" ]]; then
+        info "Python dependencies up to date"
+        return
+    fi
+
     # Use venv's pip directly (no need to activate)
     local pip_cmd="$venv_dir/bin/pip"
 
@@ -353,6 +378,11 @@ setup_venv() {
         "$pip_cmd" install -r "$SOSIE_DIR/requirements-macos.txt" --quiet
     fi
 
+    # Remember what was installed so unchanged re-runs can skip pip entirely
+    if [[ -n "$req_hash" ]]; then
+        printf '%s' "$req_hash" > "$req_marker"
+    fi
+
     info "Python dependencies installed"
 }
 